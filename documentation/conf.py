@@ -45,7 +45,6 @@ release = version = _import_version( )
 extensions = [
     'sphinx.ext.autodoc',
     'sphinx.ext.doctest',
-    'sphinx.ext.graphviz',
     'sphinx.ext.intersphinx',
     'sphinx.ext.todo',
     'sphinx.ext.githubpages',
@@ -73,7 +72,7 @@ source_suffix = {
 }
 
 nitpicky = True
-nitpick_ignore = [
+nitpick_ignore = {
     # Workaround for https://bugs.python.org/issue11975
     # Found on Stack Overflow (credit to Astropy project):
     #   https://stackoverflow.com/a/30624034
@@ -91,7 +90,7 @@ nitpick_ignore = [
     ( 'py:class', "Doc" ),
     ( 'py:class', "types.Annotated" ),
     ( 'py:class', "typing_extensions.Any" ),
-]
+}
 
 # -- Options for linkcheck builder -------------------------------------------
 
@@ -154,6 +153,9 @@ intersphinx_mapping = {
   # --- END: Injected by Copier ---
 }
 
+# Bound waits on slow inventory hosts.
+intersphinx_timeout = 5
+
 # -- Options for Myst extension ----------------------------------------------
 
 # https://myst-parser.readthedocs.io/en/latest/syntax/optional.html
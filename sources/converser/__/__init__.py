@@ -23,3 +23,14 @@
 
 from .imports import *
 from .nomina import *
+
+
+def __getattr__( name: str ) -> types.ModuleType:
+    ''' Imports lazily-loaded module on first access and caches it. '''
+    if name not in lazy_modules_qnames:
+        raise AttributeError( # noqa: TRY003
+            f"module {__name__!r} has no attribute {name!r}" )
+    from importlib import import_module
+    module = import_module( lazy_modules_qnames[ name ] )
+    globals( )[ name ] = module
+    return module
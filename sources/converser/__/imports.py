@@ -28,7 +28,6 @@ import collections.abc as   cabc
 import datetime
 import enum
 import hashlib
-import json
 import pathlib
 import                      types
 
@@ -36,9 +35,24 @@ import typing_extensions as typx
 # --- BEGIN: Injected by Copier ---
 import dynadoc as           ddoc
 import frigid as            immut
-import                      tyro
 # --- END: Injected by Copier ---
 
 # --- BEGIN: Injected by Copier ---
 from absence import Absential, absent, is_absent
 # --- END: Injected by Copier ---
+
+
+if typx.TYPE_CHECKING:
+    import json
+    # --- BEGIN: Injected by Copier ---
+    import                  tyro
+    # --- END: Injected by Copier ---
+
+
+# Modules which are not needed to define the package API.
+# Imported on first attribute access. Names to qualified module names.
+lazy_modules_qnames: types.MappingProxyType[ str, str ] = (
+    types.MappingProxyType( {
+        'json': 'json',
+        'tyro': 'tyro',
+    } ) )
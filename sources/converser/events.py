@@ -27,18 +27,24 @@ from . import __
 class Event( __.immut.DataclassObject ):
     ''' Base class for conversation events. '''
 
+    kind: __.typx.ClassVar[ int ]
+
     message_id: str
 
 
 class MessageAllocationEvent( Event ):
     ''' Message allocation begins. '''
 
+    kind = 0
+
     message_id: str
 
 
 class MessageProgressEvent( Event ):
     ''' Streaming chunk received. '''
 
+    kind = 1
+
     message_id: str
     chunk: str
 
@@ -46,18 +52,24 @@ class MessageProgressEvent( Event ):
 class MessageUpdateEvent( Event ):
     ''' Message content updated. '''
 
+    kind = 2
+
     message_id: str
 
 
 class MessageCompletionEvent( Event ):
     ''' Message finalized successfully. '''
 
+    kind = 3
+
     message_id: str
 
 
 class MessageAbortEvent( Event ):
     ''' Message generation failed. '''
 
+    kind = 4
+
     message_id: str
     error: str
 
@@ -70,4 +82,17 @@ ConversationEvent: __.typx.TypeAlias = __.typx.Union[
     MessageAbortEvent,
 ]
 
+# Runtime counterpart of union for instance checks. Ordered by kind.
+conversation_event_classes: tuple[ type[ Event ], ... ] = (
+    __.typx.get_args( ConversationEvent ) )
+
 EventHandler: __.typx.TypeAlias = __.cabc.Callable[ [ Event ], None ]
+EventHandlers: __.typx.TypeAlias = __.cabc.Sequence[ EventHandler ]
+
+
+def dispatch_event( event: Event, handlers: EventHandlers ) -> None:
+    ''' Dispatches event to handler at index of its kind, if any. '''
+    # Events without kind or handler are ignored for forward compatibility.
+    try: handler = handlers[ event.kind ]
+    except ( AttributeError, IndexError ): return
+    handler( event )
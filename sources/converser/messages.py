@@ -25,6 +25,20 @@ from . import __
 from . import canisters as _canisters
 
 
+_datetime_now = __.datetime.datetime.now
+_timezone_utc = __.datetime.timezone.utc
+
+_dictionary_empty: __.immut.Dictionary[ str, __.typx.Any ] = (
+    __.immut.Dictionary( ) )
+
+_role_assistant = _canisters.Role.Assistant
+_role_document = _canisters.Role.Document
+_role_invocation = _canisters.Role.Invocation
+_role_result = _canisters.Role.Result
+_role_supervisor = _canisters.Role.Supervisor
+_role_user = _canisters.Role.User
+
+
 class Message( __.immut.DataclassObject ):
     ''' Base class for message implementations. '''
 
@@ -47,9 +61,9 @@ class UserMessage( Message ):
     ) -> __.typx.Self:
         ''' Produces user message with defaults. '''
         if __.is_absent( timestamp ):
-            timestamp = __.datetime.datetime.now( __.datetime.timezone.utc )
+            timestamp = _datetime_now( _timezone_utc )
         return cls(
-            role = _canisters.Role.User,
+            role = _role_user,
             timestamp = timestamp,
             content = tuple( content ),
         )
@@ -72,12 +86,12 @@ class AssistantMessage( Message ):
     ) -> __.typx.Self:
         ''' Produces assistant message with defaults. '''
         if __.is_absent( timestamp ):
-            timestamp = __.datetime.datetime.now( __.datetime.timezone.utc )
+            timestamp = _datetime_now( _timezone_utc )
         content_tuple = (
             tuple( content ) if not __.is_absent( content ) else __.absent
         )
         return cls(
-            role = _canisters.Role.Assistant,
+            role = _role_assistant,
             timestamp = timestamp,
             content = content_tuple,
         )
@@ -102,14 +116,14 @@ class SupervisorMessage( Message ):
     ) -> __.typx.Self:
         ''' Produces supervisor message with defaults. '''
         if __.is_absent( timestamp ):
-            timestamp = __.datetime.datetime.now( __.datetime.timezone.utc )
+            timestamp = _datetime_now( _timezone_utc )
         cache_dict = (
-            __.immut.Dictionary( cache_control )
+            _freeze_dictionary( cache_control )
             if not __.is_absent( cache_control )
             else __.absent
         )
         return cls(
-            role = _canisters.Role.Supervisor,
+            role = _role_supervisor,
             timestamp = timestamp,
             content = tuple( content ),
             cache_control = cache_dict,
@@ -133,9 +147,9 @@ class DocumentMessage( Message ):
     ) -> __.typx.Self:
         ''' Produces document message with defaults. '''
         if __.is_absent( timestamp ):
-            timestamp = __.datetime.datetime.now( __.datetime.timezone.utc )
+            timestamp = _datetime_now( _timezone_utc )
         return cls(
-            role = _canisters.Role.Document,
+            role = _role_document,
             timestamp = timestamp,
             content = tuple( content ),
             document_id = document_id,
@@ -161,13 +175,13 @@ class InvocationMessage( Message ):
     ) -> __.typx.Self:
         ''' Produces invocation message with defaults. '''
         if __.is_absent( timestamp ):
-            timestamp = __.datetime.datetime.now( __.datetime.timezone.utc )
+            timestamp = _datetime_now( _timezone_utc )
         return cls(
-            role = _canisters.Role.Invocation,
+            role = _role_invocation,
             timestamp = timestamp,
             invocation_id = invocation_id,
             name = name,
-            arguments = __.immut.Dictionary( arguments ),
+            arguments = _freeze_dictionary( arguments ),
         )
 
 
@@ -190,11 +204,20 @@ class ResultMessage( Message ):
     ) -> __.typx.Self:
         ''' Produces result message with defaults. '''
         if __.is_absent( timestamp ):
-            timestamp = __.datetime.datetime.now( __.datetime.timezone.utc )
+            timestamp = _datetime_now( _timezone_utc )
         return cls(
-            role = _canisters.Role.Result,
+            role = _role_result,
             timestamp = timestamp,
             invocation_id = invocation_id,
             content = tuple( content ),
             error = error,
         )
+
+
+def _freeze_dictionary(
+    mapping: __.cabc.Mapping[ str, __.typx.Any ]
+) -> __.immut.Dictionary[ str, __.typx.Any ]:
+    ''' Produces immutable dictionary, reusing one which is already so. '''
+    if isinstance( mapping, __.immut.Dictionary ): return mapping
+    if not mapping: return _dictionary_empty
+    return __.immut.Dictionary( mapping )
@@ -1,3 +1,37 @@
+import pytest
+
+from . import __
+
+
+@pytest.fixture(
+    scope = 'session',
+    params = __.MODULES,
+    ids = lambda module_info: module_info.qname,
+)
+def module_info( request ):
+    ''' Names of package module. '''
+    return request.param
+
+
+@pytest.fixture( scope = 'session' )
+def module( module_info ):
+    ''' Package module, imported once per session. '''
+    return __.cache_import_module( module_info.qname )
+
+
+@pytest.fixture( scope = 'session' )
+def base_module( ):
+    ''' Package base module, imported once per session. '''
+    return __.cache_import_module( f"{__.PACKAGE_NAME}.__" )
+
+
+@pytest.fixture( scope = 'session' )
+def imports_module_names( ):
+    ''' Names in module of common imports, collected once per session. '''
+    module = __.cache_import_module( f"{__.PACKAGE_NAME}.__.imports" )
+    return frozenset( dir( module ) )
+
+
 def pytest_sessionfinish( session, exitstatus ):
     if exitstatus == 5:  # pytest exit code for "no tests collected"
         session.exitstatus = 0
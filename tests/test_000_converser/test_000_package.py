@@ -34,10 +34,7 @@ def test_000_sanity( package_name ):
     assert package.__name__ == package_name
 
 
-@pytest.mark.parametrize( 'module_qname', __.MODULES_QNAMES )
-def test_100_sanity( module_qname ):
+def test_100_sanity( module_info, module ):
     ''' Package module is sane. '''
-    package_name = __.PACKAGES_NAMES_BY_MODULE_QNAME[ module_qname ]
-    module = __.cache_import_module( module_qname )
-    assert module.__package__ == package_name
-    assert module.__name__ == module_qname
+    assert module.__package__ == module_info.package_name
+    assert module.__name__ == module_info.qname
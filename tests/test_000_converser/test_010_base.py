@@ -29,7 +29,30 @@ from . import __
 @pytest.mark.parametrize(
     'module_name', ( 'cabc', 'types', 'typx' )
 )
-def test_100_exports( module_name ):
+def test_100_exports( imports_module_names, module_name ):
     ''' Module exports expected names. '''
-    module = __.cache_import_module( f"{__.PACKAGE_NAME}.__.imports" )
-    assert hasattr( module, module_name )
+    assert module_name in imports_module_names
+
+
+@pytest.mark.parametrize( 'module_name', ( 'json', 'tyro' ) )
+def test_110_lazy_exports( module_name ):
+    ''' Lazily-loaded modules are imported on access and cached. '''
+    from subprocess import run
+    from sys import executable
+    script = ';'.join( (
+        f"import sys; from {__.PACKAGE_NAME} import __ as base",
+        f"assert {module_name!r} not in sys.modules",
+        f"assert {module_name!r} not in vars( base )",
+        f"module = base.{module_name}",
+        f"assert module is vars( base )[ {module_name!r} ]",
+    ) )
+    result = run( # noqa: S603
+        ( executable, '-c', script ),
+        capture_output = True, check = False, text = True )
+    assert 0 == result.returncode, result.stderr
+
+
+def test_120_lazy_exports_absent( base_module ):
+    ''' Access to unknown attribute raises error. '''
+    with pytest.raises( AttributeError ):
+        base_module.nonexistent_module
@@ -0,0 +1,76 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of conversation events. '''
+
+
+from . import __
+
+
+MODULE_QNAME = f"{__.PACKAGE_NAME}.events"
+
+
+def test_100_dispatch_by_kind( ):
+    ''' Each kind of event reaches its own handler. '''
+    module = __.cache_import_module( MODULE_QNAME )
+    events = (
+        module.MessageAllocationEvent( message_id = 'm' ),
+        module.MessageProgressEvent( message_id = 'm', chunk = 'c' ),
+        module.MessageUpdateEvent( message_id = 'm' ),
+        module.MessageCompletionEvent( message_id = 'm' ),
+        module.MessageAbortEvent( message_id = 'm', error = 'e' ),
+    )
+    received = [ ]
+    handlers = tuple(
+        ( lambda event, index = index: received.append( ( index, event ) ) )
+        for index in range( len( events ) ) )
+    for event in events: module.dispatch_event( event, handlers )
+    assert received == list( enumerate( events ) )
+
+
+def test_110_dispatch_ignores_base_event( ):
+    ''' Base event has no kind and reaches no handler. '''
+    module = __.cache_import_module( MODULE_QNAME )
+    received = [ ]
+    handlers = ( received.append, ) * 5
+    module.dispatch_event( module.Event( message_id = 'm' ), handlers )
+    assert not received
+
+
+def test_120_dispatch_ignores_unhandled_kinds( ):
+    ''' Kinds beyond sequence of handlers reach no handler. '''
+    module = __.cache_import_module( MODULE_QNAME )
+    received = [ ]
+    handlers = ( received.append, )
+    allocation = module.MessageAllocationEvent( message_id = 'm' )
+    module.dispatch_event( allocation, handlers )
+    module.dispatch_event(
+        module.MessageAbortEvent( message_id = 'm', error = 'e' ), handlers )
+    assert received == [ allocation ]
+
+
+def test_200_classes_ordered_by_kind( ):
+    ''' Runtime tuple of event classes is indexed by kind. '''
+    module = __.cache_import_module( MODULE_QNAME )
+    classes = module.conversation_event_classes
+    assert tuple( class_.kind for class_ in classes ) == tuple(
+        range( len( classes ) ) )
+    event = module.MessageProgressEvent( message_id = 'm', chunk = 'c' )
+    assert isinstance( event, classes )
@@ -0,0 +1,80 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+
+''' Assert correct function of message implementations. '''
+
+
+import frigid
+import pytest
+
+from absence import absent
+
+from . import __
+
+
+MODULE_QNAME = f"{__.PACKAGE_NAME}.messages"
+
+
+def test_100_invocation_reuses_dictionary( ):
+    ''' Immutable dictionary of arguments is kept as same object. '''
+    module = __.cache_import_module( MODULE_QNAME )
+    arguments = frigid.Dictionary( path = 'README.rst' )
+    message = module.InvocationMessage.produce(
+        invocation_id = 'i', name = 'read', arguments = arguments )
+    assert message.arguments is arguments
+
+
+def test_110_invocation_freezes_mapping( ):
+    ''' Plain mapping of arguments is converted to immutable dictionary. '''
+    module = __.cache_import_module( MODULE_QNAME )
+    arguments = { 'path': 'README.rst' }
+    message = module.InvocationMessage.produce(
+        invocation_id = 'i', name = 'read', arguments = arguments )
+    assert isinstance( message.arguments, frigid.Dictionary )
+    assert dict( message.arguments ) == arguments
+
+
+def test_120_invocation_shares_empty_dictionary( ):
+    ''' Empty arguments produce one shared immutable dictionary. '''
+    module = __.cache_import_module( MODULE_QNAME )
+    message1 = module.InvocationMessage.produce(
+        invocation_id = 'i1', name = 'list', arguments = { } )
+    message2 = module.InvocationMessage.produce(
+        invocation_id = 'i2', name = 'list', arguments = { } )
+    assert isinstance( message1.arguments, frigid.Dictionary )
+    assert not message1.arguments
+    assert message1.arguments is message2.arguments
+
+
+@pytest.mark.parametrize(
+    'cache_control', ( absent, { 'type': 'ephemeral' } )
+)
+def test_200_supervisor_cache_control( cache_control ):
+    ''' Absent cache control stays absent; mapping becomes immutable. '''
+    module = __.cache_import_module( MODULE_QNAME )
+    message = module.SupervisorMessage.produce(
+        content = ( ), cache_control = cache_control )
+    if cache_control is absent:
+        assert message.cache_control is absent
+    else:
+        assert isinstance( message.cache_control, frigid.Dictionary )
+        assert dict( message.cache_control ) == cache_control